@@ -7,6 +7,13 @@ Utility to manage cached satellite TLE data.
 import os
 from datetime import datetime, timezone, timedelta
 
+def stat_or_none(path):
+    """Return os.stat(path), or None if the file does not exist"""
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
 def show_cache_status():
     """Show current cache status"""
     print("TLE Cache Status:")
@@ -20,23 +27,29 @@ def show_cache_status():
     catalogs = ['visual', 'stations']
     for catalog in catalogs:
         cache_file = f'{cache_dir}/{catalog}.txt'
-        timestamp_file = f'{cache_dir}/{catalog}_timestamp.txt'
         
-        if os.path.exists(cache_file) and os.path.exists(timestamp_file):
+        # One stat, reused for existence, age and size
+        cache_stat = stat_or_none(cache_file)
+        
+        if cache_stat is not None:
             try:
-                # Get cache age
-                with open(timestamp_file, 'r') as f:
-                    cache_time_str = f.read().strip()
-                cache_time = datetime.fromisoformat(cache_time_str)
+                # Get cache age from the file's modification time
+                cache_time = datetime.fromtimestamp(cache_stat.st_mtime, tz=timezone.utc)
                 age = datetime.now(timezone.utc) - cache_time
                 
                 # Get cache size
-                size_kb = os.path.getsize(cache_file) / 1024
+                size_kb = cache_stat.st_size / 1024
                 
-                # Count satellites
-                with open(cache_file, 'r') as f:
-                    lines = f.readlines()
-                sat_count = len(lines) // 3
+                # Count satellites (3 lines each) in 64 KiB chunks
+                line_count = 0
+                last_chunk = b''
+                with open(cache_file, 'rb') as f:
+                    for chunk in iter(lambda: f.read(65536), b''):
+                        line_count += chunk.count(b'\n')
+                        last_chunk = chunk
+                if last_chunk and not last_chunk.endswith(b'\n'):
+                    line_count += 1  # Final line has no trailing newline
+                sat_count = line_count // 3
                 
                 status = "FRESH" if age < timedelta(hours=12) else "STALE"
                 
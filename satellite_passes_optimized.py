@@ -8,16 +8,26 @@ Optimized for better performance and memory usage.
 import configparser
 from datetime import datetime, timedelta, timezone
 import requests
+from requests.adapters import HTTPAdapter
 from skyfield.api import load, Topos
-from skyfield.sgp4lib import EarthSatellite
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import Satrec, SatrecArray, jday
 import numpy as np
 import pytz
 import warnings
 import logging
+from bisect import bisect_right
 from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import repeat
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Tuple, Dict, Optional
 import math
+import mmap
+import os
+import re
+import sys
 import time
 
 warnings.filterwarnings('ignore', module='skyfield')
@@ -26,6 +36,20 @@ warnings.filterwarnings('ignore', module='skyfield')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Time grid resolution in minutes (3 minutes keeps short passes from being missed)
+TIME_STEP_MINUTES = 3
+
+# Below this many satellites, process pool start-up costs more than it saves
+PARALLEL_MIN_SATELLITES = 200
+
+# Satellite name filters per catalog, matched against raw bytes. Visual: bright
+# satellites and rocket bodies, especially CZ-4B R/B as mentioned by user.
+# Stations: space stations.
+CATALOG_NAME_FILTERS = {
+    'visual': re.compile(rb'\b(ISS|HST|AJISAI|GENESIS|LAGEOS|CZ-4B|CZ-2C|SL-)', re.IGNORECASE),
+    'stations': re.compile(rb'\b(ISS|CSS|TIANHE|TIANGONG)', re.IGNORECASE),
+}
+
 # Data structures for better performance
 PassInfo = namedtuple('PassInfo', [
     'satellite', 'start_time', 'start_time_local', 'start_az', 'start_alt',
@@ -34,9 +58,15 @@ PassInfo = namedtuple('PassInfo', [
     'time_category', 'sun_elevation', 'observer_dark', 'potentially_visible', 'duration'
 ])
 
+# Sample grid with the local UTC offset resolved once per DST segment, so
+# samples convert to local time without a pytz lookup each
+TimeGrid = namedtuple('TimeGrid', ['start', 'segment_starts', 'utc_offsets', 'tzinfos'])
+
 @dataclass
 class Config:
     """Configuration class to hold all settings"""
+    __slots__ = ('lat', 'lon', 'alt', 'timezone_str', 'local_tz', 'min_elevation', 'days_ahead')
+    
     lat: float
     lon: float
     alt: float
@@ -47,29 +77,192 @@ class Config:
 
 class ProgressTracker:
     """Dedicated progress tracking class"""
+    __slots__ = ('total', 'current', 'bar_length', 'last_percent', 'flush')
+    
     def __init__(self, total: int, bar_length: int = 50):
         self.total = total
         self.current = 0
         self.bar_length = bar_length
+        self.last_percent = -1
+        # Only force a flush per redraw when a terminal is watching the bar
+        self.flush = sys.stdout.isatty()
     
     def update(self, increment: int = 1):
-        """Update progress and display progress bar"""
+        """Update progress and redraw the bar when the whole percent changes"""
         self.current += increment
-        percent = int((self.current / self.total) * 100)
-        filled_length = int(self.bar_length * self.current / self.total)
+        percent = self.current * 100 // self.total
+        if percent == self.last_percent:
+            return
+        self.last_percent = percent
+        filled_length = self.bar_length * self.current // self.total
         bar = '█' * filled_length + '░' * (self.bar_length - filled_length)
-        print(f"\r  Progress: [{bar}] {percent}% ({self.current}/{self.total})", end='', flush=True)
+        print(f"\r  Progress: [{bar}] {percent}% ({self.current}/{self.total})", end='', flush=self.flush)
     
     def finish(self):
         """Complete the progress bar"""
         print()  # Move to next line
 
+@lru_cache(maxsize=1)
+def get_timescale():
+    """Skyfield timescale, built once per process and shared by all predictors"""
+    return load.timescale()
+
+@lru_cache(maxsize=1)
+def get_planets():
+    """DE421 ephemeris, loaded once per process and shared by all predictors"""
+    return load('de421.bsp')
+
+@lru_cache(maxsize=512)
+def base_magnitude(satellite_name):
+    """Base magnitude estimate by satellite type, cached per name"""
+    name_upper = satellite_name.upper()
+    
+    # Base magnitude estimates for known satellites
+    if 'ISS' in name_upper:
+        return -3.0  # Very bright
+    elif 'HST' in name_upper or 'HUBBLE' in name_upper:
+        return 2.0   # Moderately bright
+    elif any(rocket in name_upper for rocket in ['CZ-4B', 'CZ-2C', 'SL-', 'R/B']):
+        return 3.5   # Rocket bodies, dimmer
+    elif any(station in name_upper for station in ['CSS', 'TIANHE', 'TIANGONG']):
+        return -2.0  # Space stations, bright
+    else:
+        return 4.0   # Generic satellite
+
+def categorize_pass_time(start_time_local):
+    """Categorize pass by local time"""
+    hour = start_time_local.hour
+    if 18 <= hour <= 23:
+        return "Evening"
+    elif 4 <= hour <= 8:
+        return "Morning" 
+    elif 8 <= hour <= 17:  # More precise daytime hours
+        return "Daytime"
+    else:
+        return "Night"  # 0-4 and 23-24 hours
+
+def iter_tle(mm):
+    """Yield stripped (name, line1, line2) byte triples from a mapped TLE file"""
+    while True:
+        name = mm.readline()
+        if not name:
+            return
+        if not name.strip():
+            continue  # Skip blank lines between entries
+        yield name.strip(), mm.readline().strip(), mm.readline().strip()
+
+def build_time_grid(start_time, n_samples, local_tz):
+    """Resolve local time for the sample grid with a handful of pytz lookups
+    
+    DST transitions are months apart, so the UTC offset is checked once per
+    day of the grid and bisected only inside a day whose two ends differ.
+    """
+    samples_per_day = 1440 // TIME_STEP_MINUTES
+    
+    def local_at(idx):
+        return (start_time + timedelta(minutes=idx * TIME_STEP_MINUTES)).astimezone(local_tz)
+    
+    first = local_at(0)
+    segment_starts, utc_offsets, tzinfos = [0], [first.utcoffset()], [first.tzinfo]
+    lo = 0
+    while lo < n_samples - 1:
+        hi = min(lo + samples_per_day, n_samples - 1)
+        hi_local = local_at(hi)
+        if hi_local.utcoffset() != utc_offsets[-1]:
+            # Bisect for the first sample on the new offset
+            a, b = lo, hi
+            while b - a > 1:
+                mid = (a + b) // 2
+                if local_at(mid).utcoffset() == utc_offsets[-1]:
+                    a = mid
+                else:
+                    b = mid
+            segment_starts.append(b)
+            utc_offsets.append(hi_local.utcoffset())
+            tzinfos.append(hi_local.tzinfo)
+        lo = hi
+    
+    return TimeGrid(start_time, segment_starts, utc_offsets, tzinfos)
+
+def grid_times(time_grid, idx):
+    """Return the (UTC, local) datetimes of grid sample idx"""
+    utc_time = time_grid.start + timedelta(minutes=idx * TIME_STEP_MINUTES)
+    segment = bisect_right(time_grid.segment_starts, idx) - 1
+    local_time = (utc_time + time_grid.utc_offsets[segment]).replace(tzinfo=time_grid.tzinfos[segment])
+    return utc_time, local_time
+
+def detect_passes_adaptive(sat_name, alt_degrees, az_degrees, time_grid,
+                           sun_elev_grid, min_elevation):
+    """Detect passes from precomputed altitude/azimuth samples
+    
+    Takes only NumPy arrays and picklable values so it can run in a
+    worker process.
+    """
+    # Find passes above horizon
+    above_horizon = alt_degrees > 0
+    
+    # Locate rising/setting edges in one pass; padding with False closes
+    # passes already in progress at either end of the time range
+    padded = np.concatenate(([False], above_horizon, [False]))
+    edges = np.diff(padded.astype(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)  # exclusive end index
+    
+    passes = []
+    for pass_start_idx, j in zip(starts.tolist(), ends.tolist()):
+        # Extract pass data; j is exclusive, end_idx is the last sample above the horizon
+        end_idx = j - 1
+        pass_elevations = alt_degrees[pass_start_idx:j]
+        max_elevation = np.max(pass_elevations)
+        
+        if max_elevation < min_elevation:
+            continue
+        
+        max_idx = pass_start_idx + int(np.argmax(pass_elevations))
+        
+        start_time_utc, start_time_local = grid_times(time_grid, pass_start_idx)
+        end_time_utc, end_time_local = grid_times(time_grid, end_idx)
+        max_time_utc, max_time_local = grid_times(time_grid, max_idx)
+        
+        # Look up sun elevation at pass start for visibility analysis
+        sun_elev = sun_elev_grid[pass_start_idx]
+        
+        # Determine visibility - sun must be below -6° for good visibility
+        time_category = categorize_pass_time(start_time_local)
+        observer_dark = sun_elev < -6  # Civil twilight or darker required
+        # Allow visibility during evening, morning, and night hours with proper darkness
+        potentially_visible = (observer_dark and
+                             time_category in ['Evening', 'Morning', 'Night'])
+        
+        passes.append(PassInfo(
+            satellite=sat_name,
+            start_time=start_time_utc,
+            start_time_local=start_time_local,
+            start_az=az_degrees[pass_start_idx],
+            start_alt=alt_degrees[pass_start_idx],
+            max_time=max_time_utc,
+            max_time_local=max_time_local,
+            max_az=az_degrees[max_idx],
+            max_elevation=max_elevation,
+            end_time=end_time_utc,
+            end_time_local=end_time_local,
+            end_az=az_degrees[end_idx],
+            end_alt=alt_degrees[end_idx],
+            time_category=time_category,
+            sun_elevation=sun_elev,
+            observer_dark=observer_dark,
+            potentially_visible=potentially_visible,
+            duration=(j - pass_start_idx) * TIME_STEP_MINUTES  # minutes
+        ))
+    
+    return passes
+
 class SatellitePassPredictor:
     """Main class for satellite pass prediction"""
     
     def __init__(self, config: Config):
         self.config = config
-        self.ts = load.timescale()
+        self.ts = get_timescale()
         self.observer_location = Topos(
             latitude_degrees=config.lat, 
             longitude_degrees=config.lon, 
@@ -77,64 +270,30 @@ class SatellitePassPredictor:
         )
         
         # Load ephemeris for sun calculations
-        self.planets = load('de421.bsp')
+        self.planets = get_planets()
         self.earth = self.planets['earth']
         self.sun = self.planets['sun']
         self.observer_geocentric = self.earth + self.observer_location
         
-        # Sun position cache
-        self.sun_cache = {}
-        
-        # Compass directions
-        self.directions = ["N", "NNE", "NE", "ENE", "E", "ESE", "SE", "SSE",
-                          "S", "SSW", "SW", "WSW", "W", "WNW", "NW", "NNW"]
+        # Observer ITRS position and local East/North/Up basis for batched alt/az
+        lat_rad = math.radians(config.lat)
+        lon_rad = math.radians(config.lon)
+        self.observer_itrs = self.observer_location.itrs_xyz.km
+        self.enu_matrix = np.array([
+            [-math.sin(lon_rad), math.cos(lon_rad), 0.0],
+            [-math.sin(lat_rad) * math.cos(lon_rad), -math.sin(lat_rad) * math.sin(lon_rad), math.cos(lat_rad)],
+            [math.cos(lat_rad) * math.cos(lon_rad), math.cos(lat_rad) * math.sin(lon_rad), math.sin(lat_rad)],
+        ])
     
-    def get_sun_elevation(self, t):
-        """Get sun elevation at given time with caching"""
-        # Round time to nearest 10 minutes for caching
-        cache_key = (t.whole, round(t.tt_fraction * 24 * 60 / 10) * 10)
-        if cache_key in self.sun_cache:
-            return self.sun_cache[cache_key]
-            
-        sun_position = self.observer_geocentric.at(t).observe(self.sun)
+    def compute_sun_elevations(self, t_array):
+        """Get sun elevation for every sample of the time grid in one call"""
+        sun_position = self.observer_geocentric.at(t_array).observe(self.sun)
         sun_alt, _, _ = sun_position.apparent().altaz()
-        sun_elev = sun_alt.degrees
-        
-        # Cache result
-        self.sun_cache[cache_key] = sun_elev
-        return sun_elev
-    
-    def categorize_pass_time(self, start_time_local):
-        """Categorize pass by local time"""
-        hour = start_time_local.hour
-        if 18 <= hour <= 23:
-            return "Evening"
-        elif 4 <= hour <= 8:
-            return "Morning" 
-        elif 8 <= hour <= 17:  # More precise daytime hours
-            return "Daytime"
-        else:
-            return "Night"  # 0-4 and 23-24 hours
-    
-    def az_to_compass(self, azimuth):
-        """Convert azimuth to degrees only"""
-        return f"{azimuth:.0f}°"
+        return sun_alt.degrees
     
     def estimate_magnitude(self, satellite_name, max_elevation):
         """Estimate satellite magnitude based on type and elevation"""
-        name_upper = satellite_name.upper()
-        
-        # Base magnitude estimates for known satellites
-        if 'ISS' in name_upper:
-            base_mag = -3.0  # Very bright
-        elif 'HST' in name_upper or 'HUBBLE' in name_upper:
-            base_mag = 2.0   # Moderately bright
-        elif any(rocket in name_upper for rocket in ['CZ-4B', 'CZ-2C', 'SL-', 'R/B']):
-            base_mag = 3.5   # Rocket bodies, dimmer
-        elif any(station in name_upper for station in ['CSS', 'TIANHE', 'TIANGONG']):
-            base_mag = -2.0  # Space stations, bright
-        else:
-            base_mag = 4.0   # Generic satellite
+        base_mag = base_magnitude(satellite_name)
         
         # Adjust for elevation (higher = brighter due to less atmosphere)
         elevation_factor = (max_elevation - 10) * 0.02  # Brighter at higher elevations
@@ -142,11 +301,40 @@ class SatellitePassPredictor:
         
         return max(-4.0, min(6.0, estimated_mag))  # Clamp between -4 and +6
     
+    def download_catalog(self, session, catalog_name, url):
+        """Download one TLE catalog into the cache, retrying on failure"""
+        cache_file = f'tle_cache/{catalog_name}.txt'
+        max_retries = 3
+        retry_delay = 5  # seconds
+        
+        for attempt in range(max_retries):
+            try:
+                print(f"  Downloading fresh {catalog_name} catalog (attempt {attempt + 1}/{max_retries})...")
+                response = session.get(url, timeout=30)
+                response.raise_for_status()
+                
+                # Save to cache; its modification time records the download time
+                with open(cache_file, 'w') as f:
+                    f.write(response.text)
+                    
+                print(f"  Cached {catalog_name} data")
+                return
+                
+            except Exception as e:
+                logger.warning(f"  Warning: Could not download {catalog_name} (attempt {attempt + 1}): {e}")
+                if attempt < max_retries - 1:
+                    print(f"  Retrying in {retry_delay} seconds...")
+                    time.sleep(retry_delay)
+        
+        if os.path.exists(cache_file):
+            print(f"  Using existing cached {catalog_name} data")
+    
     def get_cached_tle_data(self):
-        """Load TLE data from cache or download if needed"""
-        import os
-        from datetime import timedelta
+        """Load TLE data from cache or download if needed
         
+        Returns parallel lists (names, satrecs); TLEs are parsed once here and
+        the Satrec list feeds SatrecArray directly.
+        """
         os.makedirs('tle_cache', exist_ok=True)
         
         urls = {
@@ -154,255 +342,141 @@ class SatellitePassPredictor:
             'stations': 'https://celestrak.com/NORAD/elements/stations.txt'
         }
         
-        satellites = []
-        
+        stale_catalogs = {}
         for catalog_name, url in urls.items():
             cache_file = f'tle_cache/{catalog_name}.txt'
-            cache_age_file = f'tle_cache/{catalog_name}_timestamp.txt'
             
             # Check if cache exists and is fresh (less than 24 hours old)
             should_download = True
-            if os.path.exists(cache_file) and os.path.exists(cache_age_file):
-                try:
-                    with open(cache_age_file, 'r') as f:
-                        cache_time_str = f.read().strip()
-                    cache_time = datetime.fromisoformat(cache_time_str)
-                    age = datetime.now(timezone.utc) - cache_time
-                    
-                    if age < timedelta(hours=24):
-                        print(f"  Using cached {catalog_name} data (age: {age.total_seconds()/3600:.1f} hours)")
-                        should_download = False
-                except Exception:
-                    pass
+            try:
+                cache_time = datetime.fromtimestamp(os.stat(cache_file).st_mtime, tz=timezone.utc)
+                age = datetime.now(timezone.utc) - cache_time
+                
+                if age < timedelta(hours=24):
+                    print(f"  Using cached {catalog_name} data (age: {age.total_seconds()/3600:.1f} hours)")
+                    should_download = False
+            except FileNotFoundError:
+                pass
             
-            # Download if needed with retry logic
             if should_download:
-                max_retries = 3
-                retry_delay = 5  # seconds
-                
-                for attempt in range(max_retries):
-                    try:
-                        print(f"  Downloading fresh {catalog_name} catalog (attempt {attempt + 1}/{max_retries})...")
-                        response = requests.get(url, timeout=30)
-                        response.raise_for_status()
-                        
-                        # Save to cache
-                        with open(cache_file, 'w') as f:
-                            f.write(response.text)
-                        with open(cache_age_file, 'w') as f:
-                            f.write(datetime.now(timezone.utc).isoformat())
-                            
-                        print(f"  Cached {catalog_name} data")
-                        break  # Success, exit retry loop
-                        
-                    except Exception as e:
-                        logger.warning(f"  Warning: Could not download {catalog_name} (attempt {attempt + 1}): {e}")
-                        if attempt < max_retries - 1:
-                            print(f"  Retrying in {retry_delay} seconds...")
-                            time.sleep(retry_delay)
-                        else:
-                            if not os.path.exists(cache_file):
-                                continue
-                            print(f"  Using existing cached {catalog_name} data")
+                stale_catalogs[catalog_name] = url
+        
+        # Download stale catalogs concurrently over one keep-alive session
+        if stale_catalogs:
+            with requests.Session() as session:
+                session.mount('https://', HTTPAdapter(pool_connections=len(urls), pool_maxsize=len(urls)))
+                with ThreadPoolExecutor(max_workers=len(stale_catalogs)) as executor:
+                    downloads = [executor.submit(self.download_catalog, session, catalog_name, url)
+                                 for catalog_name, url in stale_catalogs.items()]
+                    for download in downloads:
+                        download.result()
+        
+        names = []
+        satrecs = []
+        
+        for catalog_name in urls:
+            cache_file = f'tle_cache/{catalog_name}.txt'
+            name_filter = CATALOG_NAME_FILTERS[catalog_name]
             
             # Load from cache
             try:
-                with open(cache_file, 'r') as f:
-                    lines = f.read().strip().split('\n')
+                with open(cache_file, 'rb') as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        continue  # mmap cannot map an empty file
+                    
+                    # Scan the mapped file and decode only the entries the filter keeps
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        for name, line1, line2 in iter_tle(mm):
+                            if line1.startswith(b'1 ') and line2.startswith(b'2 ') and name_filter.search(name):
+                                names.append(name.decode())
+                                satrecs.append(Satrec.twoline2rv(line1.decode(), line2.decode()))
                 
-                # Parse satellites - be more selective for performance
-                for i in range(0, len(lines), 3):
-                    if i + 2 < len(lines):
-                        name = lines[i].strip()
-                        line1 = lines[i + 1].strip()
-                        line2 = lines[i + 2].strip()
-                        
-                        if line1.startswith('1 ') and line2.startswith('2 '):
-                            # Include more satellites, especially CZ-4B R/B as mentioned by user
-                            if catalog_name == 'visual':
-                                # Include bright visual satellites and rocket bodies
-                                keywords = ['ISS', 'HST', 'AJISAI', 'GENESIS', 'LAGEOS', 'CZ-4B', 'CZ-2C', 'SL-']
-                                if any(keyword in name.upper() for keyword in keywords):
-                                    satellites.append((name, line1, line2))
-                            elif catalog_name == 'stations':
-                                # Include space stations
-                                if any(keyword in name.upper() for keyword in ['ISS', 'CSS', 'TIANHE', 'TIANGONG']):
-                                    satellites.append((name, line1, line2))
-                                    
             except Exception as e:
                 logger.error(f"  Error reading cached {catalog_name} data: {e}")
                 continue
         
-        return satellites
+        return names, satrecs
     
-    def filter_satellites_by_orbit(self, satellites):
+    def filter_satellites_by_orbit(self, names, satrecs):
         """Filter satellites based on orbital characteristics to reduce calculations"""
         # For now, we'll keep all satellites but this could be enhanced
         # to filter based on inclination and observer latitude
-        return satellites
+        return names, satrecs
     
-    def detect_passes_adaptive(self, satellite, t_array, time_range):
-        """Detect passes using adaptive time sampling"""
-        # Calculate satellite positions
-        positions = (satellite - self.observer_location).at(t_array)
-        alt_degrees, az_degrees, distance = positions.altaz()
+    def propagate_altaz(self, satrecs, t_array, jd, fr):
+        """Propagate all satellites over the time grid in one batched SGP4 call
         
-        # Find passes above horizon
-        above_horizon = alt_degrees.degrees > 0
+        Returns (alt, az) arrays in degrees with shape (n_satellites, n_times).
+        Samples where SGP4 reports an error are returned as NaN.
+        """
+        errors, r_teme, _ = SatrecArray(satrecs).sgp4(jd, fr)
         
-        # Find pass segments
-        passes = []
-        in_pass = False
-        pass_start_idx = None
+        # TEME -> ITRS: rotate about the z axis by Greenwich mean sidereal time
+        theta, _ = theta_GMST1982(t_array.whole, t_array.ut1_fraction)
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        zeros, ones = np.zeros_like(theta), np.ones_like(theta)
+        rotation = np.array([
+            [cos_t, sin_t, zeros],
+            [-sin_t, cos_t, zeros],
+            [zeros, zeros, ones],
+        ])
+        r_itrs = np.einsum('ijt,ntj->nti', rotation, r_teme)
         
-        for j, is_above in enumerate(above_horizon):
-            if is_above and not in_pass:
-                # Start of pass
-                in_pass = True
-                pass_start_idx = j
-            elif not is_above and in_pass:
-                # End of pass
-                in_pass = False
-                if pass_start_idx is not None:
-                    # Extract pass data
-                    pass_elevations = alt_degrees.degrees[pass_start_idx:j]
-                    max_elevation = np.max(pass_elevations)
-                    
-                    if max_elevation >= self.config.min_elevation:
-                        max_idx = pass_start_idx + np.argmax(pass_elevations)
-                        
-                        start_time_utc = time_range[pass_start_idx]
-                        end_time_utc = time_range[j-1]
-                        max_time_utc = time_range[max_idx]
-                        
-                        start_time_local = start_time_utc.astimezone(self.config.local_tz)
-                        end_time_local = end_time_utc.astimezone(self.config.local_tz)
-                        max_time_local = max_time_utc.astimezone(self.config.local_tz)
-                        
-                        # Get sun elevation at pass time for visibility analysis
-                        pass_time_skyfield = t_array[pass_start_idx]
-                        sun_elev = self.get_sun_elevation(pass_time_skyfield)
-                        
-                        # Determine visibility - sun must be below -6° for good visibility
-                        time_category = self.categorize_pass_time(start_time_local)
-                        observer_dark = sun_elev < -6  # Civil twilight or darker required
-                        # Allow visibility during evening, morning, and night hours with proper darkness
-                        potentially_visible = (observer_dark and
-                                             time_category in ['Evening', 'Morning', 'Night'])
-                        
-                        passes.append(PassInfo(
-                            satellite=satellite.name,
-                            start_time=start_time_utc,
-                            start_time_local=start_time_local,
-                            start_az=az_degrees.degrees[pass_start_idx],
-                            start_alt=alt_degrees.degrees[pass_start_idx],
-                            max_time=max_time_utc,
-                            max_time_local=max_time_local,
-                            max_az=az_degrees.degrees[max_idx],
-                            max_elevation=max_elevation,
-                            end_time=end_time_utc,
-                            end_time_local=end_time_local,
-                            end_az=az_degrees.degrees[j-1],
-                            end_alt=alt_degrees.degrees[j-1],
-                            time_category=time_category,
-                            sun_elevation=sun_elev,
-                            observer_dark=observer_dark,
-                            potentially_visible=potentially_visible,
-                            duration=(j - pass_start_idx) * 3  # minutes (3 min intervals)
-                        ))
+        # Topocentric East/North/Up components relative to the observer
+        enu = np.einsum('ij,ntj->nti', self.enu_matrix, r_itrs - self.observer_itrs)
+        east, north, up = enu[..., 0], enu[..., 1], enu[..., 2]
         
-        # Handle case where pass is still in progress at end of time range
-        if in_pass and pass_start_idx is not None:
-            j = len(above_horizon)
-            pass_elevations = alt_degrees.degrees[pass_start_idx:j]
-            max_elevation = np.max(pass_elevations)
-            
-            if max_elevation >= self.config.min_elevation:
-                max_idx = pass_start_idx + np.argmax(pass_elevations)
-                
-                start_time_utc = time_range[pass_start_idx]
-                end_time_utc = time_range[j-1]
-                max_time_utc = time_range[max_idx]
-                
-                start_time_local = start_time_utc.astimezone(self.config.local_tz)
-                end_time_local = end_time_utc.astimezone(self.config.local_tz)
-                max_time_local = max_time_utc.astimezone(self.config.local_tz)
-                
-                # Get sun elevation at pass time for visibility analysis
-                pass_time_skyfield = t_array[pass_start_idx]
-                sun_elev = self.get_sun_elevation(pass_time_skyfield)
-                
-                # Determine visibility - sun must be below -6° for good visibility
-                time_category = self.categorize_pass_time(start_time_local)
-                observer_dark = sun_elev < -6  # Civil twilight or darker required
-                # Allow visibility during evening, morning, and night hours with proper darkness
-                potentially_visible = (observer_dark and
-                                     time_category in ['Evening', 'Morning', 'Night'])
-                
-                passes.append(PassInfo(
-                    satellite=satellite.name,
-                    start_time=start_time_utc,
-                    start_time_local=start_time_local,
-                    start_az=az_degrees.degrees[pass_start_idx],
-                    start_alt=alt_degrees.degrees[pass_start_idx],
-                    max_time=max_time_utc,
-                    max_time_local=max_time_local,
-                    max_az=az_degrees.degrees[max_idx],
-                    max_elevation=max_elevation,
-                    end_time=end_time_utc,
-                    end_time_local=end_time_local,
-                    end_az=az_degrees.degrees[j-1],
-                    end_alt=alt_degrees.degrees[j-1],
-                    time_category=time_category,
-                    sun_elevation=sun_elev,
-                    observer_dark=observer_dark,
-                    potentially_visible=potentially_visible,
-                    duration=(j - pass_start_idx) * 3  # minutes (3 min intervals)
-                ))
-        
-        return passes
+        alt = np.degrees(np.arcsin(up / np.linalg.norm(enu, axis=-1)))
+        az = np.degrees(np.arctan2(east, north)) % 360.0
+        alt[errors != 0] = np.nan
+        return alt, az
     
-    def calculate_passes_vectorized(self, satellites):
+    def calculate_passes_vectorized(self, names, satrecs):
         """Calculate passes using vectorized operations for better performance"""
         # Time range - next 24 hours
         now = datetime.now(timezone.utc)
         start_time = now
         end_time = now + timedelta(hours=self.config.days_ahead * 24)
         
-        # Create time array with 3-minute intervals for accuracy
-        def create_time_array(start_time, end_time, interval=3):
-            """Create time array with consistent 3-minute intervals"""
-            time_range = []
-            current = start_time
-            while current < end_time:
-                time_range.append(current)
-                current += timedelta(minutes=interval)
-            return time_range
+        # Sample every 3 minutes for accuracy, built as one array of minute offsets
+        step = timedelta(minutes=TIME_STEP_MINUTES)
+        n_samples = math.ceil((end_time - start_time) / step)
+        minute_offsets = np.arange(n_samples) * TIME_STEP_MINUTES
+        seconds = start_time.second + start_time.microsecond / 1e6
         
-        # Convert to Skyfield time objects
-        time_range = create_time_array(start_time, end_time)
-        time_tuples = []
-        for t in time_range:
-            utc_t = t.astimezone(timezone.utc) if t.tzinfo else t
-            time_tuples.append((utc_t.year, utc_t.month, utc_t.day, utc_t.hour, utc_t.minute, utc_t.second))
+        # Skyfield normalizes the out-of-range minutes into a proper UTC grid
+        t_array = self.ts.utc(start_time.year, start_time.month, start_time.day,
+                              start_time.hour, start_time.minute + minute_offsets, seconds)
+        jd0, fr0 = jday(start_time.year, start_time.month, start_time.day,
+                        start_time.hour, start_time.minute, seconds)
+        jd = np.full(n_samples, jd0)
+        fr = fr0 + minute_offsets / 1440.0
+        time_grid = build_time_grid(start_time, n_samples, self.config.local_tz)
         
-        t_array = self.ts.utc(*zip(*time_tuples))
+        # Sun elevation for the whole grid, indexed per pass below
+        sun_elev_grid = self.compute_sun_elevations(t_array)
         
         all_passes = []
-        progress = ProgressTracker(len(satellites))
+        progress = ProgressTracker(len(names))
+        if not names:
+            progress.finish()
+            return all_passes
         
-        # Process satellites individually for accuracy
-        for sat_name, line1, line2 in satellites:
-            progress.update()
-            satellite = EarthSatellite(line1, line2, sat_name, self.ts)
-            
-            try:
-                # Detect passes with 3-minute time sampling for accuracy
-                passes = self.detect_passes_adaptive(satellite, t_array, time_range)
+        # Propagate every satellite over the whole time grid at once
+        alt_grid, az_grid = self.propagate_altaz(satrecs, t_array, jd, fr)
+        
+        # Detect passes per satellite, fanning out across CPUs for large catalogs
+        detect_args = (names, alt_grid, az_grid, repeat(time_grid), repeat(sun_elev_grid),
+                       repeat(self.config.min_elevation))
+        if len(names) >= PARALLEL_MIN_SATELLITES:
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                for passes in executor.map(detect_passes_adaptive, *detect_args, chunksize=8):
+                    progress.update()
+                    all_passes.extend(passes)
+        else:
+            for passes in map(detect_passes_adaptive, *detect_args):
+                progress.update()
                 all_passes.extend(passes)
-                
-            except Exception:
-                continue
         
         progress.finish()
         return all_passes
@@ -416,10 +490,10 @@ class SatellitePassPredictor:
             
             for pass_info in passes:
                 start_time_str = pass_info.start_time_local.strftime("%H:%M")
-                start_dir = self.az_to_compass(pass_info.start_az)
+                start_dir = f"{pass_info.start_az:.0f}°"
                 
                 end_time_str = pass_info.end_time_local.strftime("%H:%M")
-                end_dir = self.az_to_compass(pass_info.end_az)
+                end_dir = f"{pass_info.end_az:.0f}°"
                 
                 max_elevation_str = f"{pass_info.max_elevation:3.0f}°"
                 
@@ -438,15 +512,15 @@ class SatellitePassPredictor:
         
         try:
             print("Loading satellite TLE data...")
-            satellites = self.get_cached_tle_data()
-            print(f"Found {len(satellites)} bright satellites")
+            names, satrecs = self.get_cached_tle_data()
+            print(f"Found {len(names)} bright satellites")
             
             # Filter satellites by orbit (could be enhanced)
-            filtered_satellites = self.filter_satellites_by_orbit(satellites)
+            names, satrecs = self.filter_satellites_by_orbit(names, satrecs)
             
             # Calculate passes
-            print(f"\nCalculating passes for {len(filtered_satellites)} satellites...")
-            all_passes = self.calculate_passes_vectorized(filtered_satellites)
+            print(f"\nCalculating passes for {len(names)} satellites...")
+            all_passes = self.calculate_passes_vectorized(names, satrecs)
             
             # Sort passes by start time
             all_passes.sort(key=lambda x: x.start_time)
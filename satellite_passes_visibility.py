@@ -5,16 +5,215 @@ Shows satellite passes with detailed visibility information.
 """
 
 import configparser
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from functools import lru_cache
 import requests
 from skyfield.api import load, Topos
-from skyfield.sgp4lib import EarthSatellite
+from skyfield.sgp4lib import theta_GMST1982
+from sgp4.api import Satrec, SatrecArray, jday
 import numpy as np
+import os
 import pytz
+import re
+import time
 import warnings
 
 warnings.filterwarnings('ignore', module='skyfield')
 
+# Pass times are resolved on a 1-minute grid, but satellites are first searched on a
+# coarse grid and only refined around coarse samples above CANDIDATE_MIN_ALTITUDE.
+# A LEO pass peaking at the horizon is still well above -20° within 5 minutes.
+TIME_STEP_MINUTES = 1
+COARSE_STEP_MINUTES = 10
+CANDIDATE_MIN_ALTITUDE = -20.0
+
+# Catalog size at which propagation is spread over a process pool
+PARALLEL_MIN_SATELLITES = 200
+
+# Satellites propagated per batched SGP4 call (bounds the (n_sats, n_times, 3) arrays)
+SATELLITE_CHUNK = 64
+
+# TLEs with an epoch further than this from now are skipped (SGP4 degrades past ~2 weeks)
+MAX_TLE_AGE = timedelta(days=14)
+
+# Mean motion (rev/day) below which an orbit is treated as geosynchronous and skipped
+MIN_MEAN_MOTION = 2.0
+
+# Earth equatorial radius (km) and gravitational parameter (km^3/s^2), WGS72 as in SGP4
+EARTH_RADIUS_KM = 6378.135
+EARTH_MU = 398600.8
+
+# Slack (degrees) for the orbit-geometry pre-filter: geodetic vs geocentric observer
+# latitude, and perturbations that the two-body apogee ignores
+REACH_MARGIN_DEG = 2.0
+
+# Case-insensitive name filters per catalog, one compiled regex scan per TLE.
+# Visual: bright visual satellites and rocket bodies, especially CZ-4B R/B as
+# mentioned by user. Stations: space stations.
+CATALOG_NAME_FILTERS = {
+    'visual': re.compile(r'ISS|HST|AJISAI|GENESIS|LAGEOS|CZ-4B|CZ-2C|SL-', re.IGNORECASE),
+    'stations': re.compile(r'ISS|CSS|TIANHE|TIANGONG', re.IGNORECASE),
+}
+
+def extract_passes(alt_deg, min_elevation):
+    """Return (start_idx, max_idx, end_idx, max_alt) arrays for passes above
+    the horizon that peak at or above min_elevation (end_idx is inclusive)"""
+    # Pad with False so passes in progress at either end of the grid have edges
+    above_horizon = alt_deg > 0
+    padded = np.concatenate(([False], above_horizon, [False]))
+    edges = np.diff(padded.view(np.int8))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    if len(starts) == 0:
+        empty = np.empty(0, dtype=np.intp)
+        return empty, empty, empty, np.empty(0)
+    
+    # Segment maxima in one reduceat, with below-horizon samples masked out
+    masked = np.where(above_horizon, alt_deg, -np.inf)
+    max_alts = np.maximum.reduceat(masked, starts)
+    keep = max_alts >= min_elevation
+    starts, ends, max_alts = starts[keep], ends[keep], max_alts[keep]
+    
+    # argmax only for the (few) segments that survive the elevation filter
+    max_idx = np.array([s + np.argmax(alt_deg[s:e + 1]) for s, e in zip(starts, ends)],
+                       dtype=np.intp)
+    return starts, max_idx, ends, max_alts
+
+@lru_cache(maxsize=1)
+def get_timescale():
+    """Skyfield timescale, built once per process"""
+    return load.timescale()
+
+@lru_cache(maxsize=4096)
+def get_satrec(line1, line2):
+    """SGP4 satellite record for a TLE, reused when the same TLE is seen again in
+    this process (e.g. ISS listed in both catalogs, or main() called repeatedly)"""
+    return Satrec.twoline2rv(line1, line2)
+
+def max_reachable_latitude(line2, min_elevation):
+    """Highest observer latitude (degrees) from which the orbit can reach min_elevation
+    
+    The ground track never leaves |lat| <= inclination (180 - inclination for
+    retrograde orbits), and from apogee the satellite is above min_elevation within
+    a cone of central angle arccos(R cos(el) / r_apogee) - el around its sub-point.
+    """
+    inclination = float(line2[8:16])
+    eccentricity = float('0.' + line2[26:33])
+    mean_motion = float(line2[52:63]) * 2 * np.pi / 86400.0  # rad/s
+    
+    r_apogee = (EARTH_MU / mean_motion ** 2) ** (1 / 3) * (1 + eccentricity)
+    el = np.radians(min_elevation)
+    footprint = np.degrees(np.arccos(min(1.0, EARTH_RADIUS_KM * np.cos(el) / r_apogee)) - el)
+    return min(inclination, 180.0 - inclination) + footprint + REACH_MARGIN_DEG
+
+def base_magnitude(name_upper):
+    """Base magnitude estimate by satellite type, from the upper-cased name"""
+    if 'ISS' in name_upper:
+        return -3.0  # Very bright
+    elif 'HST' in name_upper or 'HUBBLE' in name_upper:
+        return 2.0   # Moderately bright
+    elif any(rocket in name_upper for rocket in ['CZ-4B', 'CZ-2C', 'SL-', 'R/B']):
+        return 3.5   # Rocket bodies, dimmer
+    elif any(station in name_upper for station in ['CSS', 'TIANHE', 'TIANGONG']):
+        return -2.0  # Space stations, bright
+    else:
+        return 4.0   # Generic satellite
+
+def tle_epoch(line1):
+    """UTC epoch of a TLE from columns 19-32 of line 1 (YYDDD.DDDDDDDD)"""
+    year = int(line1[18:20])
+    year += 2000 if year < 57 else 1900
+    return datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(days=float(line1[20:32]) - 1)
+
+# Pass category by local start hour: 18-23 Evening, 4-8 Morning, 9-17 Daytime,
+# 0-3 Night
+HOUR_CATEGORIES = np.array(['Night'] * 4 + ['Morning'] * 5 + ['Daytime'] * 9 + ['Evening'] * 6)
+
+# Pass records are stored column-wise: one array per field, indexed by pass
+PASS_COLUMNS = {
+    'satellite': object,
+    'base_mag': float,
+    'start_idx': np.intp,
+    'max_idx': np.intp,
+    'end_idx': np.intp,
+    'start_az': float,
+    'start_alt': float,
+    'max_az': float,
+    'max_elevation': float,
+    'end_az': float,
+    'end_alt': float,
+}
+
+# Per-process state for compute_passes(), filled by init_worker() in pool workers
+worker_context = {}
+
+def init_worker(context):
+    """Install the shared time grid and observer frame in a worker process"""
+    worker_context.update(context)
+
+def altaz_from_teme(r_teme, sample_idx):
+    """Altitude and azimuth in degrees for TEME positions (..., n, 3) at fine-grid samples"""
+    # TEME -> ITRS by Greenwich sidereal time, then topocentric East/North/Up
+    r_itrs = np.einsum('ijt,...tj->...ti', worker_context['teme_to_itrs'][:, :, sample_idx], r_teme)
+    enu = np.einsum('ij,...tj->...ti', worker_context['enu_matrix'],
+                    r_itrs - worker_context['observer_itrs'])
+    alt = np.degrees(np.arcsin(enu[..., 2] / np.linalg.norm(enu, axis=-1)))
+    az = np.degrees(np.arctan2(enu[..., 0], enu[..., 1])) % 360.0
+    return alt, az
+
+def compute_passes(sat_chunk):
+    """Pass geometry for a chunk of (name, name_upper, line1, line2) satellites
+    over the shared grid, as a dict of PASS_COLUMNS lists"""
+    satrecs = [get_satrec(line1, line2) for _, _, line1, line2 in sat_chunk]
+    jd, fr = worker_context['jd'], worker_context['fr']
+    n_samples = len(jd)
+    
+    # Coarse search: one SGP4 call for the whole chunk on the coarse sub-grid
+    stride = COARSE_STEP_MINUTES // TIME_STEP_MINUTES
+    coarse_idx = np.arange(0, n_samples, stride)
+    errors, r_teme, _ = SatrecArray(satrecs).sgp4(jd[coarse_idx], fr[coarse_idx])
+    coarse_alt, _ = altaz_from_teme(r_teme, coarse_idx)
+    coarse_alt[errors != 0] = np.nan  # SGP4 failures (e.g. decayed orbits) never count as passes
+    
+    columns = {name: [] for name in PASS_COLUMNS}
+    window = np.arange(-stride, stride + 1)
+    for (sat_name, name_upper, _, _), satrec, alt_coarse in zip(sat_chunk, satrecs, coarse_alt):
+        candidates = coarse_idx[alt_coarse > CANDIDATE_MIN_ALTITUDE]
+        if len(candidates) == 0:
+            continue
+        
+        # Refine on the full-resolution grid, one coarse step either side of each candidate
+        sample_idx = np.unique(np.clip((candidates[:, None] + window).ravel(), 0, n_samples - 1))
+        errors, r_teme, _ = satrec.sgp4_array(jd[sample_idx], fr[sample_idx])
+        alt_fine, az_fine = altaz_from_teme(r_teme, sample_idx)
+        alt_fine[errors != 0] = np.nan
+        
+        # Samples that were never refined stay NaN, i.e. below the horizon
+        alt_deg = np.full(n_samples, np.nan)
+        az_deg = np.full(n_samples, np.nan)
+        alt_deg[sample_idx] = alt_fine
+        az_deg[sample_idx] = az_fine
+        
+        starts, max_idx, ends, max_alts = extract_passes(alt_deg, worker_context['min_elevation'])
+        if len(starts) == 0:
+            continue
+        
+        # Base magnitude depends only on the satellite, so it is looked up once here
+        columns['satellite'].extend([sat_name] * len(starts))
+        columns['base_mag'].extend([base_magnitude(name_upper)] * len(starts))
+        columns['start_idx'].extend(starts)
+        columns['max_idx'].extend(max_idx)
+        columns['end_idx'].extend(ends)
+        columns['start_az'].extend(az_deg[starts])
+        columns['start_alt'].extend(alt_deg[starts])
+        columns['max_az'].extend(az_deg[max_idx])
+        columns['max_elevation'].extend(max_alts)
+        columns['end_az'].extend(az_deg[ends])
+        columns['end_alt'].extend(alt_deg[ends])
+    return columns
+
 def main():
     # Read configuration
     config = configparser.ConfigParser()
@@ -38,7 +237,9 @@ def main():
         # Cache satellite TLE data locally
         def get_cached_tle_data():
             """Load TLE data from cache or download if needed"""
+            import hashlib
             import os
+            import pickle
             from datetime import timedelta
             
             os.makedirs('tle_cache', exist_ok=True)
@@ -48,283 +249,296 @@ def main():
                 'stations': 'https://celestrak.com/NORAD/elements/stations.txt'
             }
             
-            satellites = []
-            
+            stale_catalogs = {}
             for catalog_name, url in urls.items():
                 cache_file = f'tle_cache/{catalog_name}.txt'
-                cache_age_file = f'tle_cache/{catalog_name}_timestamp.txt'
                 
                 # Check if cache exists and is fresh (less than 24 hours old)
                 should_download = True
-                if os.path.exists(cache_file) and os.path.exists(cache_age_file):
-                    try:
-                        with open(cache_age_file, 'r') as f:
-                            cache_time_str = f.read().strip()
-                        cache_time = datetime.fromisoformat(cache_time_str)
-                        age = datetime.now(timezone.utc) - cache_time
-                        
-                        if age < timedelta(hours=24):
-                            print(f"  Using cached {catalog_name} data (age: {age.total_seconds()/3600:.1f} hours)")
-                            should_download = False
-                    except Exception:
-                        pass
+                cache_time = None
+                try:
+                    cache_time = datetime.fromtimestamp(os.stat(cache_file).st_mtime, tz=timezone.utc)
+                    age = datetime.now(timezone.utc) - cache_time
+                    
+                    if age < timedelta(hours=24):
+                        print(f"  Using cached {catalog_name} data (age: {age.total_seconds()/3600:.1f} hours)")
+                        should_download = False
+                except FileNotFoundError:
+                    pass
                 
-                # Download if needed
                 if should_download:
-                    try:
+                    stale_catalogs[catalog_name] = (url, cache_time)
+            
+            # Download stale catalogs concurrently over one keep-alive session;
+            # responses are written to the cache from this thread
+            if stale_catalogs:
+                with requests.Session() as session, \
+                        ThreadPoolExecutor(max_workers=len(stale_catalogs)) as executor:
+                    downloads = {}
+                    for catalog_name, (url, cache_time) in stale_catalogs.items():
+                        # Conditional GET: an unchanged catalog costs a 304 instead of the body
+                        headers = {}
+                        if cache_time is not None:
+                            headers['If-Modified-Since'] = format_datetime(cache_time, usegmt=True)
                         print(f"  Downloading fresh {catalog_name} catalog...")
-                        response = requests.get(url, timeout=30)
-                        response.raise_for_status()
-                        
-                        # Save to cache
-                        with open(cache_file, 'w') as f:
-                            f.write(response.text)
-                        with open(cache_age_file, 'w') as f:
-                            f.write(datetime.now(timezone.utc).isoformat())
+                        downloads[catalog_name] = executor.submit(session.get, url, headers=headers,
+                                                                  timeout=30)
+                    
+                    for catalog_name, download in downloads.items():
+                        cache_file = f'tle_cache/{catalog_name}.txt'
+                        try:
+                            response = download.result()
+                            if response.status_code == 304:
+                                # Not modified upstream: mark the existing cache fresh again
+                                os.utime(cache_file)
+                                print(f"  {catalog_name} catalog unchanged, keeping cached data")
+                                continue
+                            response.raise_for_status()
                             
-                        print(f"  Cached {catalog_name} data")
-                        
-                    except Exception as e:
-                        print(f"  Warning: Could not download {catalog_name}: {e}")
-                        if not os.path.exists(cache_file):
-                            continue
-                        print(f"  Using existing cached {catalog_name} data")
-                
+                            # Save to cache; its modification time records the download time
+                            with open(cache_file, 'w') as f:
+                                f.write(response.text)
+                                
+                            print(f"  Cached {catalog_name} data")
+                            
+                        except Exception as e:
+                            print(f"  Warning: Could not download {catalog_name}: {e}")
+                            if os.path.exists(cache_file):
+                                print(f"  Using existing cached {catalog_name} data")
+            
+            available = [(catalog_name, f'tle_cache/{catalog_name}.txt') for catalog_name in urls
+                         if os.path.exists(f'tle_cache/{catalog_name}.txt')]
+            
+            # Reuse the parsed satellite list if neither the cache files nor the name
+            # filters that select from them changed
+            parsed_file = 'tle_cache/parsed.pkl'
+            digest = hashlib.md5(b'name,name_upper,line1,line2')  # Record layout
+            for catalog_name, cache_file in available:
+                name_filter = CATALOG_NAME_FILTERS[catalog_name]
+                digest.update(f'{catalog_name}:{name_filter.flags}:{name_filter.pattern}'.encode())
+                with open(cache_file, 'rb') as f:
+                    digest.update(f.read())
+            digest = digest.hexdigest()
+            
+            try:
+                with open(parsed_file, 'rb') as f:
+                    cached_digest, satellites = pickle.load(f)
+                if cached_digest == digest:
+                    return satellites
+            except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+                pass
+            
+            satellites = []
+            for catalog_name, cache_file in available:
                 # Load from cache
+                name_filter = CATALOG_NAME_FILTERS[catalog_name]
                 try:
+                    # Parse satellites - be more selective for performance.
+                    # Stream (name, line1, line2) triples straight from the file.
                     with open(cache_file, 'r') as f:
-                        lines = f.read().strip().split('\n')
-                    
-                    # Parse satellites - be more selective for performance
-                    for i in range(0, len(lines), 3):
-                        if i + 2 < len(lines):
-                            name = lines[i].strip()
-                            line1 = lines[i + 1].strip()
-                            line2 = lines[i + 2].strip()
+                        lines = iter(f)
+                        for name in lines:
+                            name = name.strip()
+                            if not name:
+                                continue  # Blank line between or after entries
+                            try:
+                                line1 = next(lines).strip()
+                                line2 = next(lines).strip()
+                            except StopIteration:
+                                break  # Truncated final entry
                             
                             if line1.startswith('1 ') and line2.startswith('2 '):
-                                # Include more satellites, especially CZ-4B R/B as mentioned by user
-                                if catalog_name == 'visual':
-                                    # Include bright visual satellites and rocket bodies
-                                    keywords = ['ISS', 'HST', 'AJISAI', 'GENESIS', 'LAGEOS', 'CZ-4B', 'CZ-2C', 'SL-']
-                                    if any(keyword in name.upper() for keyword in keywords):
-                                        satellites.append((name, line1, line2))
-                                elif catalog_name == 'stations':
-                                    # Include space stations
-                                    if any(keyword in name.upper() for keyword in ['ISS', 'CSS', 'TIANHE', 'TIANGONG']):
-                                        satellites.append((name, line1, line2))
+                                if name_filter.search(name):
+                                    satellites.append((name, name.upper(), line1, line2))
                                         
                 except Exception as e:
                     print(f"  Error reading cached {catalog_name} data: {e}")
                     continue
             
+            try:
+                with open(parsed_file, 'wb') as f:
+                    pickle.dump((digest, satellites), f, protocol=pickle.HIGHEST_PROTOCOL)
+            except OSError as e:
+                print(f"  Warning: Could not cache parsed TLE data: {e}")
+            
             return satellites
         
         print("Loading satellite TLE data...")
         satellites = get_cached_tle_data()
+        
+        # Skip TLEs too old for SGP4 to be meaningful, geosynchronous orbits, which
+        # never rise or set over 24 hours, and orbits whose ground track never comes
+        # close enough to reach min_elevation; all checked from the raw TLE columns
+        now = datetime.now(timezone.utc)
+        n_loaded = len(satellites)
+        satellites = [sat for sat in satellites
+                      if abs(now - tle_epoch(sat[2])) <= MAX_TLE_AGE
+                      and float(sat[3][52:63]) >= MIN_MEAN_MOTION
+                      and max_reachable_latitude(sat[3], min_elevation) >= abs(lat)]
+        if len(satellites) < n_loaded:
+            print(f"  Skipped {n_loaded - len(satellites)} satellites with stale TLEs, "
+                  f"geosynchronous orbits or no reachable passes")
         print(f"Found {len(satellites)} bright satellites")
         
         # Setup Skyfield
-        ts = load.timescale()
+        ts = get_timescale()
         observer_location = Topos(latitude_degrees=lat, longitude_degrees=lon, elevation_m=alt)
         
-        # Load ephemeris for sun calculations
-        planets = load('de421.bsp')
-        earth = planets['earth']
-        sun = planets['sun']
-        observer_geocentric = earth + observer_location
+        @lru_cache(maxsize=1)
+        def sun_ephemeris():
+            """Observer and sun from the DE421 ephemeris, loaded on first use"""
+            planets = load('de421.bsp')
+            return planets['earth'] + observer_location, planets['sun']
         
         # Simplified visibility functions
         def get_sun_elevation(t):
-            """Get sun elevation at given time"""
+            """Get sun elevation at given time (scalar or array)"""
+            observer_geocentric, sun = sun_ephemeris()
             sun_position = observer_geocentric.at(t).observe(sun)
             sun_alt, _, _ = sun_position.apparent().altaz()
             return sun_alt.degrees
         
-        def categorize_pass_time(start_time_local):
-            """Categorize pass by local time"""
-            hour = start_time_local.hour
-            if 18 <= hour <= 23:
-                return "Evening"
-            elif 4 <= hour <= 8:
-                return "Morning" 
-            elif 8 <= hour <= 17:  # More precise daytime hours
-                return "Daytime"
-            else:
-                return "Night"  # 0-4 and 23-24 hours
-        
-        # Time range - next 24 hours
+        # Time range - next 24 hours, sampled every minute for pass timing.
+        # One shared grid for all satellites, as a Skyfield Time for the sun and as
+        # SGP4 (jd, fr) pairs for batched propagation.
         now = datetime.now(timezone.utc)
         start_time = now
-        end_time = now + timedelta(hours=24)
+        minute_offsets = np.arange(0, 24 * 60, TIME_STEP_MINUTES)
+        t_array = ts.utc(start_time.year, start_time.month, start_time.day,
+                         start_time.hour, start_time.minute + minute_offsets, start_time.second)
+        jd0, fr0 = jday(start_time.year, start_time.month, start_time.day,
+                        start_time.hour, start_time.minute, start_time.second)
+        
+        # TEME -> ITRS rotation about the z axis by Greenwich mean sidereal time
+        theta, _ = theta_GMST1982(t_array.whole, t_array.ut1_fraction)
+        cos_t, sin_t = np.cos(theta), np.sin(theta)
+        zeros, ones = np.zeros_like(theta), np.ones_like(theta)
+        
+        # Observer ITRS position and local East/North/Up basis
+        lat_rad, lon_rad = np.radians(lat), np.radians(lon)
+        grid_context = {
+            'jd': np.full(len(minute_offsets), jd0),
+            'fr': fr0 + minute_offsets / 1440.0,
+            'teme_to_itrs': np.array([
+                [cos_t, sin_t, zeros],
+                [-sin_t, cos_t, zeros],
+                [zeros, zeros, ones],
+            ]),
+            'observer_itrs': observer_location.itrs_xyz.km,
+            'enu_matrix': np.array([
+                [-np.sin(lon_rad), np.cos(lon_rad), 0.0],
+                [-np.sin(lat_rad) * np.cos(lon_rad), -np.sin(lat_rad) * np.sin(lon_rad), np.cos(lat_rad)],
+                [np.cos(lat_rad) * np.cos(lon_rad), np.cos(lat_rad) * np.sin(lon_rad), np.sin(lat_rad)],
+            ]),
+            'min_elevation': min_elevation,
+        }
         
-        all_passes = []
+        def grid_time(idx):
+            """UTC datetime of grid sample idx, built only for pass boundaries"""
+            return start_time + timedelta(minutes=int(minute_offsets[idx]))
         
         print(f"\nCalculating passes for {len(satellites)} satellites...")
         
+        last_percent, last_draw = -1, 0.0
+        
         def update_progress_bar(current, total):
-            """Display a progress bar"""
+            """Display a progress bar, redrawn at most once per percent and 50 ms"""
+            nonlocal last_percent, last_draw
             percent = int((current / total) * 100)
+            draw_time = time.monotonic()
+            if current < total and (percent == last_percent or draw_time - last_draw < 0.05):
+                return
+            last_percent, last_draw = percent, draw_time
+            
             bar_length = 50
             filled_length = int(bar_length * current / total)
             bar = '█' * filled_length + '░' * (bar_length - filled_length)
             print(f"\r  Progress: [{bar}] {percent}% ({current}/{total})", end='', flush=True)
         
-        for i, (sat_name, line1, line2) in enumerate(satellites, 1):
-            update_progress_bar(i, len(satellites))
-            satellite = EarthSatellite(line1, line2, sat_name, ts)
-            
-            try:
-                # Create time array - sample every 3 minutes for better accuracy
-                time_range = []
-                current = start_time
-                while current < end_time:
-                    time_range.append(current)
-                    current += timedelta(minutes=3)
-                
-                # Convert to Skyfield time objects
-                time_tuples = []
-                for t in time_range:
-                    utc_t = t.astimezone(timezone.utc) if t.tzinfo else t
-                    time_tuples.append((utc_t.year, utc_t.month, utc_t.day, utc_t.hour, utc_t.minute, utc_t.second))
-                
-                t_array = ts.utc(*zip(*time_tuples))
-                
-                # Calculate satellite positions
-                positions = (satellite - observer_location).at(t_array)
-                alt_degrees, az_degrees, distance = positions.altaz()
-                
-                # Find passes above horizon
-                above_horizon = alt_degrees.degrees > 0
-                
-                # Find pass segments
-                passes = []
-                in_pass = False
-                pass_start_idx = None
-                
-                for j, is_above in enumerate(above_horizon):
-                    if is_above and not in_pass:
-                        # Start of pass
-                        in_pass = True
-                        pass_start_idx = j
-                    elif not is_above and in_pass:
-                        # End of pass
-                        in_pass = False
-                        if pass_start_idx is not None:
-                            # Extract pass data
-                            pass_elevations = alt_degrees.degrees[pass_start_idx:j]
-                            max_elevation = np.max(pass_elevations)
-                            
-                            if max_elevation >= min_elevation:
-                                max_idx = pass_start_idx + np.argmax(pass_elevations)
-                                
-                                start_time_utc = time_range[pass_start_idx]
-                                end_time_utc = time_range[j-1]
-                                max_time_utc = time_range[max_idx]
-                                
-                                start_time_local = start_time_utc.astimezone(local_tz)
-                                end_time_local = end_time_utc.astimezone(local_tz)
-                                max_time_local = max_time_utc.astimezone(local_tz)
-                                
-                                # Get sun elevation at pass time for visibility analysis
-                                pass_time_skyfield = t_array[pass_start_idx]
-                                sun_elev = get_sun_elevation(pass_time_skyfield)
-                                
-                                # Determine visibility - sun must be below -6° for good visibility
-                                time_category = categorize_pass_time(start_time_local)  
-                                observer_dark = sun_elev < -6  # Civil twilight or darker required
-                                # Allow visibility during evening, morning, and night hours with proper darkness
-                                potentially_visible = (observer_dark and 
-                                                     time_category in ['Evening', 'Morning', 'Night'])
-                                
-                                passes.append({
-                                    'satellite': sat_name,
-                                    'start_time': start_time_utc,
-                                    'start_time_local': start_time_local,
-                                    'start_az': az_degrees.degrees[pass_start_idx],
-                                    'start_alt': alt_degrees.degrees[pass_start_idx],
-                                    'max_time': max_time_utc,
-                                    'max_time_local': max_time_local,
-                                    'max_az': az_degrees.degrees[max_idx],
-                                    'max_elevation': max_elevation,
-                                    'end_time': end_time_utc,
-                                    'end_time_local': end_time_local,
-                                    'end_az': az_degrees.degrees[j-1],
-                                    'end_alt': alt_degrees.degrees[j-1],
-                                    'time_category': time_category,
-                                    'sun_elevation': sun_elev,
-                                    'observer_dark': observer_dark,
-                                    'potentially_visible': potentially_visible,
-                                    'duration': (j - pass_start_idx) * 3  # minutes (3 min intervals)
-                                })
-                
-                all_passes.extend(passes)
-                
-            except Exception as e:
-                continue
+        # Propagate in chunks of satellites; large catalogs fan the chunks out across
+        # CPUs. The grid context is plain NumPy arrays, so it pickles cheaply.
+        chunks = [satellites[i:i + SATELLITE_CHUNK]
+                  for i in range(0, len(satellites), SATELLITE_CHUNK)]
+        columns = {name: [] for name in PASS_COLUMNS}
+        
+        def collect(chunk_results):
+            done = 0
+            for chunk, chunk_columns in zip(chunks, chunk_results):
+                done += len(chunk)
+                update_progress_bar(done, len(satellites))
+                for name, values in chunk_columns.items():
+                    columns[name].extend(values)
+        
+        if len(satellites) >= PARALLEL_MIN_SATELLITES:
+            with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=init_worker,
+                                     initargs=(grid_context,)) as executor:
+                collect(executor.map(compute_passes, chunks))
+        else:
+            init_worker(grid_context)
+            collect(map(compute_passes, chunks))
         
         # Complete the progress bar
         print()  # Move to next line after progress bar
         
-        # Sort passes by start time
-        all_passes.sort(key=lambda x: x['start_time'])
+        # Sort passes by start time (grid index order); stable, so ties keep catalog order
+        passes = {name: np.array(values, dtype=PASS_COLUMNS[name])
+                  for name, values in columns.items()}
+        order = np.argsort(passes['start_idx'], kind='stable')
+        passes = {name: values[order] for name, values in passes.items()}
+        
+        # Local start times and sun elevation at pass start for visibility analysis
+        start_times_local = [grid_time(idx).astimezone(local_tz) for idx in passes['start_idx']]
+        # One vectorized sun call at all pass starts; the ephemeris is only loaded
+        # when there is at least one pass to check
+        if len(passes['start_idx']):
+            sun_elev = get_sun_elevation(t_array[passes['start_idx']])
+        else:
+            sun_elev = np.empty(0)
+        
+        # Determine visibility - sun must be below -6° for good visibility
+        start_hours = np.array([t.hour for t in start_times_local], dtype=np.intp)
+        time_category = HOUR_CATEGORIES[start_hours]
+        observer_dark = sun_elev < -6  # Civil twilight or darker required
+        # Allow visibility during evening, morning, and night hours with proper darkness
+        potentially_visible = observer_dark & np.isin(time_category, ['Evening', 'Morning', 'Night'])
         
-        # Separate passes by visibility
-        visible_passes = [p for p in all_passes if p['potentially_visible']]
-        evening_passes = [p for p in visible_passes if p['time_category'] == 'Evening']
-        morning_passes = [p for p in visible_passes if p['time_category'] == 'Morning']
+        # Separate passes by visibility, as index arrays into the pass columns
+        visible_passes = np.flatnonzero(potentially_visible)
+        evening_passes = visible_passes[time_category[visible_passes] == 'Evening']
+        morning_passes = visible_passes[time_category[visible_passes] == 'Morning']
         
         # Convert azimuth to degrees only
         def az_to_compass(azimuth):
             return f"{azimuth:.0f}°"
         
-        def estimate_magnitude(satellite_name, max_elevation):
-            """Estimate satellite magnitude based on type and elevation"""
-            name_upper = satellite_name.upper()
-            
-            # Base magnitude estimates for known satellites
-            if 'ISS' in name_upper:
-                base_mag = -3.0  # Very bright
-            elif 'HST' in name_upper or 'HUBBLE' in name_upper:
-                base_mag = 2.0   # Moderately bright
-            elif any(rocket in name_upper for rocket in ['CZ-4B', 'CZ-2C', 'SL-', 'R/B']):
-                base_mag = 3.5   # Rocket bodies, dimmer
-            elif any(station in name_upper for station in ['CSS', 'TIANHE', 'TIANGONG']):
-                base_mag = -2.0  # Space stations, bright
-            else:
-                base_mag = 4.0   # Generic satellite
-            
-            # Adjust for elevation (higher = brighter due to less atmosphere)
-            elevation_factor = (max_elevation - 10) * 0.02  # Brighter at higher elevations
-            estimated_mag = base_mag - elevation_factor
-            
-            return max(-4.0, min(6.0, estimated_mag))  # Clamp between -4 and +6
+        # Estimated magnitudes: adjust for elevation (higher = brighter due to less
+        # atmosphere), clamped between -4 and +6
+        magnitudes = np.clip(passes['base_mag'] - (passes['max_elevation'] - 10) * 0.02, -4.0, 6.0)
 
-        def print_passes(passes, title):
-            if passes:
-                print(f"\n{title} ({len(passes)} passes):")
+        def print_passes(rows, title):
+            if len(rows):
+                print(f"\n{title} ({len(rows)} passes):")
                 print("Start | Start Dir | Stop  | Stop Dir | Max Alt | Mag   | Satellite")
                 print("-" * 75)
                 
-                for pass_info in passes:
-                    start_time_str = pass_info['start_time_local'].strftime("%H:%M")
-                    start_dir = az_to_compass(pass_info['start_az'])  # Degrees only
+                for i in rows:
+                    start_time_str = start_times_local[i].strftime("%H:%M")
+                    start_dir = az_to_compass(passes['start_az'][i])  # Degrees only
                     
-                    end_time_str = pass_info['end_time_local'].strftime("%H:%M")
-                    end_dir = az_to_compass(pass_info['end_az'])
+                    end_time_str = grid_time(passes['end_idx'][i]).astimezone(local_tz).strftime("%H:%M")
+                    end_dir = az_to_compass(passes['end_az'][i])
                     
-                    max_elevation_str = f"{pass_info['max_elevation']:3.0f}°"
+                    max_elevation_str = f"{passes['max_elevation'][i]:3.0f}°"
                     
-                    magnitude = estimate_magnitude(pass_info['satellite'], pass_info['max_elevation'])
-                    mag_str = f"{magnitude:+4.1f}"
+                    mag_str = f"{magnitudes[i]:+4.1f}"
                     
-                    print(f"{start_time_str:>5} | {start_dir:>9} | {end_time_str:>5} | {end_dir:>8} | {max_elevation_str:>7} | {mag_str:>5} | {pass_info['satellite']}")
+                    print(f"{start_time_str:>5} | {start_dir:>9} | {end_time_str:>5} | {end_dir:>8} | {max_elevation_str:>7} | {mag_str:>5} | {passes['satellite'][i]}")
         
         # Output results
         current_local = datetime.now(local_tz)
         print(f"\nCurrent local time: {current_local.strftime('%Y-%m-%d %H:%M:%S %Z')}")
         
-        if visible_passes:
+        if len(visible_passes):
             print(f"\n🌟 POTENTIALLY VISIBLE PASSES ({len(visible_passes)} total)")
             print("(Observer in darkness, optimal viewing conditions)")
             print_passes(evening_passes, "🌆 EVENING PASSES (6 PM - 11 PM)")